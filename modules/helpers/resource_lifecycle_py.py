@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import ast
+import hashlib
+import importlib
+import importlib.machinery
+import json
+import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Final, Generator, Iterable, Optional
 
-TARGET_SIGS: dict[tuple[Optional[str], str], str] = {
+# Keyed by the (module, name) tuple _call_signature already builds and
+# memoizes, so classifying a call is one C-level dict lookup. An exec-generated
+# if-chain over these entries measured about 2x slower and would be left
+# uncompiled by the mypyc build.
+TARGET_SIGS: Final[dict[tuple[Optional[str], str], str]] = {
     (None, "open"): "file_handle",
     ("builtins", "open"): "file_handle",
     ("io", "open"): "file_handle",
@@ -23,27 +36,94 @@ TARGET_SIGS: dict[tuple[Optional[str], str], str] = {
     ("asyncio", "create_task"): "asyncio_task",
 }
 
-RELEASE_METHODS = {
-    "file_handle": {"close"},
-    "socket_handle": {"close", "shutdown"},
-    "popen_handle": {"wait", "communicate", "terminate", "kill"},
-    "asyncio_task": {"cancel"},
+# Every acquisition (aliased or not) spells its target name somewhere in the
+# file, so files matching none of these cannot produce a record.
+_NEEDLES: Final[list[bytes]] = sorted({re.escape(name.encode()) for _, name in TARGET_SIGS})
+
+
+def _re_needle_search(needles: list[bytes]) -> Callable[[bytes], bool]:
+    pattern = re.compile(b"|".join(needles))
+    return lambda data: pattern.search(data) is not None
+
+
+def _hyperscan_needle_search(needles: list[bytes]) -> Optional[Callable[[bytes], bool]]:
+    """Hyperscan-backed predicate, or None if hyperscan is missing or unusable."""
+    try:
+        hyperscan = importlib.import_module("hyperscan")
+    except ImportError:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=needles,
+            ids=list(range(len(needles))),
+            elements=len(needles),
+            flags=[0] * len(needles),
+        )
+    except hyperscan.error:
+        # e.g. a CPU or platform the library does not support.
+        return None
+    terminated = hyperscan.ScanTerminated
+
+    def on_match(*_: object) -> bool:
+        return True  # first hit is enough; stop the scan
+
+    def search(data: bytes) -> bool:
+        try:
+            database.scan(data, match_event_handler=on_match)
+        except terminated:
+            return True
+        return False
+
+    return search
+
+
+def _build_needle_search() -> Callable[[bytes], bool]:
+    """Return a predicate telling whether raw source mentions any target name.
+
+    Uses Hyperscan's single-pass matcher when the optional ``hyperscan``
+    package is installed and usable here, and falls back to one ``re``
+    alternation otherwise.
+    """
+    return _hyperscan_needle_search(_NEEDLES) or _re_needle_search(_NEEDLES)
+
+
+_has_needle: Final = _build_needle_search()
+
+RELEASE_METHODS: Final[dict[str, frozenset[str]]] = {
+    "file_handle": frozenset({"close"}),
+    "socket_handle": frozenset({"close", "shutdown"}),
+    "popen_handle": frozenset({"wait", "communicate", "terminate", "kill"}),
+    "asyncio_task": frozenset({"cancel"}),
 }
 
-TASK_RELEASE_SIGS = {
+# Reverse index so a release call costs one lookup on the method name.
+METHOD_TO_KINDS: Final[dict[str, tuple[str, ...]]] = {
+    method: tuple(kind for kind, methods in RELEASE_METHODS.items() if method in methods)
+    for methods in RELEASE_METHODS.values()
+    for method in methods
+}
+
+TASK_RELEASE_SIGS: Final[frozenset[tuple[str, str]]] = frozenset({
     ("asyncio", "gather"),
     ("asyncio", "wait"),
     ("asyncio", "wait_for"),
-}
+})
+
+# Final call names of every signature the analyzer acts on; other calls are
+# rejected before any alias resolution.
+TRACKED_CALL_NAMES: Final[frozenset[str]] = frozenset(
+    {name for _, name in TARGET_SIGS} | {name for _, name in TASK_RELEASE_SIGS}
+)
 
-MESSAGE_TEMPLATES = {
+MESSAGE_TEMPLATES: Final[dict[str, str]] = {
     "file_handle": "File handle {name} opened without context manager or close()",
     "socket_handle": "Socket {name} opened without close()",
     "popen_handle": "subprocess handle {name} never waited/terminated",
     "asyncio_task": "asyncio task {name} neither awaited nor cancelled",
 }
 
-IGNORED_PARTS = {
+IGNORED_PARTS: Final[frozenset[str]] = frozenset({
     ".git",
     "__pycache__",
     ".mypy_cache",
@@ -58,35 +138,127 @@ IGNORED_PARTS = {
     "envs",
     "site-packages",
     "target",
-}
-
-
-class ResourceRecord:
-    __slots__ = ("name", "kind", "lineno", "released")
-
-    def __init__(self, name: Optional[str], kind: str, lineno: int) -> None:
-        self.name = name
-        self.kind = kind
-        self.lineno = lineno
-        self.released = False
-
-
-class Analyzer(ast.NodeVisitor):
-    def __init__(self, tree: ast.AST) -> None:
-        self.tree = tree
+})
+
+_MISS: Final = object()
+
+# Bits stored on Call nodes under _FLAGS_ATTR. AST nodes accept arbitrary
+# attributes and each tree is discarded after its file is analyzed.
+_FLAGS_ATTR: Final = "_rlp_flags"
+SAFE: Final = 1
+ASSIGNED: Final = 2
+
+# Fields that never hold a statement or expression: contexts, operators and
+# plain identifiers/flags. Skipping them keeps Load()/Store() and operator
+# singletons off the walk stack.
+_LEAF_FIELDS: Final[frozenset[str]] = frozenset({
+    "ctx",
+    "op",
+    "ops",
+    "id",
+    "attr",
+    "name",
+    "asname",
+    "module",
+    "arg",
+    "level",
+    "kind",
+    "conversion",
+    "is_async",
+    "type_comment",
+    "type_ignores",
+})
+
+# Node classes whose fields are raw Python values rather than child nodes.
+_CONSTANT_NODES: Final[frozenset[type]] = frozenset({ast.Constant, ast.MatchSingleton})
+
+# type(node) -> fields that may hold child nodes, filled on first sight.
+_CHILD_ATTRS: Final[dict[type, tuple[str, ...]]] = {}
+
+
+def _child_attrs(cls: type) -> tuple[str, ...]:
+    attrs = _CHILD_ATTRS.get(cls)
+    if attrs is None:
+        if cls in _CONSTANT_NODES:
+            attrs = ()
+        else:
+            fields: tuple[str, ...] = getattr(cls, "_fields", ())
+            attrs = tuple(field for field in fields if field not in _LEAF_FIELDS)
+        _CHILD_ATTRS[cls] = attrs
+    return attrs
+
+
+# Below this many files, process-pool startup costs more than it saves.
+PARALLEL_MIN_FILES: Final = 32
+
+# SHA-256 of the .py a native build was compiled from. Empty in the source;
+# scripts/build_native_helpers.sh fills it in on the copy it compiles.
+SOURCE_DIGEST: Final = ""
+
+# path -> (st_mtime_ns, st_size, issues)
+CacheEntry = tuple[int, int, list[str]]
+
+
+class Analyzer:
+    def __init__(self) -> None:
         self.aliases: dict[str, tuple[Optional[str], Optional[str]]] = {}
-        self.records: list[ResourceRecord] = []
-        self.by_name: dict[str, list[ResourceRecord]] = {}
-        self.safe_calls: set[int] = set()
-        self.assigned_calls: set[int] = set()
+        # Records are stored column-wise; a record is an index into these.
+        self._rec_name: list[Optional[str]] = []
+        self._rec_kind: list[str] = []
+        self._rec_line: list[int] = []
+        self._rec_released = bytearray()
+        self.by_name: defaultdict[str, list[int]] = defaultdict(list)
+        # The same Call is resolved from the with/assign handlers and again
+        # when the walk reaches it; nodes outlive the walk, so ids are stable.
+        self._sig_cache: dict[int, Optional[tuple[Optional[str], str]]] = {}
+        self._handlers: dict[type, Callable[[Any], None]] = {
+            ast.Import: self._h_import,
+            ast.ImportFrom: self._h_importfrom,
+            ast.With: self._h_with,
+            ast.AsyncWith: self._h_with,
+            ast.Assign: self._h_assign,
+            ast.AnnAssign: self._h_annassign,
+            ast.Call: self._h_call,
+            ast.Await: self._h_await,
+        }
+
+    def reset(self) -> None:
+        """Forget the previous file so one instance can serve many."""
+        self.aliases.clear()
+        self._rec_name.clear()
+        self._rec_kind.clear()
+        self._rec_line.clear()
+        self._rec_released.clear()
+        self.by_name.clear()
+        self._sig_cache.clear()
+
+    def walk(self, tree: ast.AST) -> None:
+        """Visit every node once, pre-order and in source order."""
+        handlers = self._handlers
+        stack: list[ast.AST] = [tree]
+        while stack:
+            node = stack.pop()
+            handler = handlers.get(type(node))
+            if handler is not None:
+                handler(node)
+            # Push children reversed so they pop in source order; releases
+            # must be seen after the acquisitions that precede them.
+            for attr in reversed(_child_attrs(type(node))):
+                value = getattr(node, attr, None)
+                if isinstance(value, list):
+                    for item in reversed(value):
+                        if isinstance(item, ast.AST):
+                            stack.append(item)
+                elif isinstance(value, ast.AST):
+                    stack.append(value)
 
     # Imports -------------------------------------------------------------
-    def visit_Import(self, node: ast.Import) -> None:
+    def _h_import(self, node: ast.Import) -> None:
         for alias in node.names:
             asname = alias.asname or alias.name
             self.aliases[asname] = (alias.name, None)
 
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+    def _h_importfrom(self, node: ast.ImportFrom) -> None:
         module = node.module or ""
         for alias in node.names:
             if alias.name == "*":
@@ -95,13 +267,8 @@ class Analyzer(ast.NodeVisitor):
             self.aliases[asname] = (module, alias.name)
 
     # With/async with -----------------------------------------------------
-    def visit_With(self, node: ast.With) -> None:
+    def _h_with(self, node: ast.With | ast.AsyncWith) -> None:
         self._mark_context_safe(node.items)
-        self.generic_visit(node)
-
-    def visit_AsyncWith(self, node: ast.AsyncWith) -> None:
-        self._mark_context_safe(node.items)
-        self.generic_visit(node)
 
     def _mark_context_safe(self, items: list[ast.withitem]) -> None:
         for item in items:
@@ -111,7 +278,7 @@ class Analyzer(ast.NodeVisitor):
         if isinstance(expr, ast.Call):
             sig = self._call_signature(expr)
             if sig and sig in TARGET_SIGS:
-                self.safe_calls.add(id(expr))
+                setattr(expr, _FLAGS_ATTR, getattr(expr, _FLAGS_ATTR, 0) | SAFE)
             for arg in expr.args:
                 self._mark_safe_calls(arg)
             for kw in expr.keywords:
@@ -121,16 +288,14 @@ class Analyzer(ast.NodeVisitor):
             self._mark_safe_calls(expr.value)
 
     # Assignments --------------------------------------------------------
-    def visit_Assign(self, node: ast.Assign) -> None:
+    def _h_assign(self, node: ast.Assign) -> None:
         self._handle_assignment(node.targets, node.value)
-        self.generic_visit(node)
 
-    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+    def _h_annassign(self, node: ast.AnnAssign) -> None:
         if node.value is not None:
             self._handle_assignment([node.target], node.value)
-        self.generic_visit(node)
 
-    def _handle_assignment(self, targets: list[ast.expr], value: ast.AST) -> None:
+    def _handle_assignment(self, targets: list[ast.expr], value: ast.expr) -> None:
         sig = self._call_signature_from_expr(value)
         print(f"Assign val={value}, sig={sig}", file=sys.stderr)
         if not sig:
@@ -139,7 +304,7 @@ class Analyzer(ast.NodeVisitor):
         print(f"Kind={kind}", file=sys.stderr)
         if not kind:
             return
-        self.assigned_calls.add(id(value))
+        setattr(value, _FLAGS_ATTR, getattr(value, _FLAGS_ATTR, 0) | ASSIGNED)
         names = [name for target in targets for name in self._collect_names(target)]
         if not names:
             self._add_record(None, kind, value.lineno)
@@ -148,46 +313,54 @@ class Analyzer(ast.NodeVisitor):
             self._add_record(name, kind, value.lineno)
 
     def _collect_names(self, node: ast.expr) -> list[str]:
-        if isinstance(node, (ast.Tuple, ast.List)):
-            names: list[str] = []
-            for elt in node.elts:
-                names.extend(self._collect_names(elt))
-            return names
-        dotted = self._dotted_name(node)
-        return [dotted] if dotted else []
+        names: list[str] = []
+        stack = [node]
+        while stack:
+            target = stack.pop()
+            # Exact type checks: cheaper than isinstance, and AST node
+            # classes are never subclassed here.
+            if type(target) is ast.Tuple or type(target) is ast.List:
+                stack.extend(reversed(target.elts))
+            elif type(target) is ast.Starred:
+                stack.append(target.value)
+            else:
+                dotted = self._dotted_name(target)
+                if dotted:
+                    names.append(dotted)
+        return names
 
     # Calls/releases -----------------------------------------------------
-    def visit_Call(self, node: ast.Call) -> None:
-        if id(node) not in self.assigned_calls:
-            sig = self._call_signature(node)
-            if sig and sig in TARGET_SIGS and id(node) not in self.safe_calls:
-                self._add_record(None, TARGET_SIGS[sig], node.lineno)
+    def _h_call(self, node: ast.Call) -> None:
+        # Tagged calls were already handled as context-managed or assigned
+        # acquisitions, and an acquisition is never also a release call.
+        if getattr(node, _FLAGS_ATTR, 0):
+            return
+        sig = self._call_signature(node)
+        if sig:
+            kind = TARGET_SIGS.get(sig)
+            if kind:
+                self._add_record(None, kind, node.lineno)
         self._handle_release(node)
-        self.generic_visit(node)
 
-    def visit_Await(self, node: ast.Await) -> None:
+    def _h_await(self, node: ast.Await) -> None:
         if isinstance(node.value, ast.Name):
-            self._mark_released(node.value.id, "asyncio_task")
-        self.generic_visit(node)
+            self._mark_released(node.value.id, ("asyncio_task",))
 
     def _handle_release(self, node: ast.Call) -> None:
         func = node.func
         if isinstance(func, ast.Attribute):
-            name = self._dotted_name(func.value)
-            method = func.attr
-            for kind, methods in RELEASE_METHODS.items():
-                if method in methods:
-                    self._mark_released(name, kind)
-                    break
+            kinds = METHOD_TO_KINDS.get(func.attr)
+            if kinds:
+                self._mark_released(self._dotted_name(func.value), kinds)
 
         sig = self._call_signature(node)
         if sig in TASK_RELEASE_SIGS:
             for arg_name in self._iter_task_args(node.args):
-                self._mark_released(arg_name, "asyncio_task")
+                self._mark_released(arg_name, ("asyncio_task",))
             for kw in node.keywords:
                 if kw.value is not None:
                     for arg_name in self._iter_task_args([kw.value]):
-                        self._mark_released(arg_name, "asyncio_task")
+                        self._mark_released(arg_name, ("asyncio_task",))
 
     def _iter_task_args(self, args: Iterable[ast.AST]) -> Iterable[str]:
         for arg in args:
@@ -198,22 +371,28 @@ class Analyzer(ast.NodeVisitor):
                     yield from self._iter_task_args([elt])
 
     # Helpers ------------------------------------------------------------
-    def _mark_released(self, name: Optional[str], kind: str) -> None:
+    def _mark_released(self, name: Optional[str], kinds: tuple[str, ...]) -> None:
         if not name:
             return
         entries = self.by_name.get(name)
         if not entries:
             return
-        for rec in entries:
-            if not rec.released and rec.kind == kind:
-                rec.released = True
+        released = self._rec_released
+        rec_kind = self._rec_kind
+        for index in entries:
+            if not released[index] and rec_kind[index] in kinds:
+                released[index] = 1
                 return
 
-    def _add_record(self, name: Optional[str], kind: str, lineno: int) -> None:
-        rec = ResourceRecord(name, kind, lineno)
-        self.records.append(rec)
+    def _add_record(self, name: Optional[str], kind: str, lineno: int) -> int:
+        index = len(self._rec_kind)
+        self._rec_name.append(name)
+        self._rec_kind.append(kind)
+        self._rec_line.append(lineno)
+        self._rec_released.append(0)
         if name:
-            self.by_name.setdefault(name, []).append(rec)
+            self.by_name[name].append(index)
+        return index
 
     def _call_signature_from_expr(self, expr: ast.AST) -> Optional[tuple[Optional[str], str]]:
         if isinstance(expr, ast.Call):
@@ -221,6 +400,25 @@ class Analyzer(ast.NodeVisitor):
         return None
 
     def _call_signature(self, call: ast.Call) -> Optional[tuple[Optional[str], str]]:
+        key = id(call)
+        cached = self._sig_cache.get(key, _MISS)
+        if cached is not _MISS:
+            return cached  # type: ignore[return-value]
+        result = None
+        if self._terminal_name(call) in TRACKED_CALL_NAMES:
+            result = self._resolve_call_signature(call)
+        self._sig_cache[key] = result
+        return result
+
+    def _terminal_name(self, call: ast.Call) -> Optional[str]:
+        func = call.func
+        if isinstance(func, ast.Name):
+            return self.aliases.get(func.id, (None, None))[1] or func.id
+        if isinstance(func, ast.Attribute):
+            return func.attr
+        return None
+
+    def _resolve_call_signature(self, call: ast.Call) -> Optional[tuple[Optional[str], str]]:
         func = call.func
         if isinstance(func, ast.Name):
             module, obj = self.aliases.get(func.id, (None, None))
@@ -240,7 +438,8 @@ class Analyzer(ast.NodeVisitor):
                 if dotted:
                     return (dotted, attr)
             if isinstance(base, ast.Call):
-                inner = self._call_signature(base)
+                # Unfiltered: Path(...).open() needs the untracked Path(...).
+                inner = self._resolve_call_signature(base)
                 if inner:
                     module, obj = inner
                     module_name = module or ""
@@ -260,40 +459,63 @@ class Analyzer(ast.NodeVisitor):
 
     def report(self, path: Path) -> list[str]:
         issues: list[str] = []
-        for rec in sorted(self.records, key=lambda r: (r.lineno, r.kind, r.name or "")):
-            if rec.released:
-                continue
-            template = MESSAGE_TEMPLATES.get(rec.kind, "Resource not released")
-            subject = rec.name or rec.kind
-            message = template.format(name=subject)
-            issues.append(f"{path}:{rec.lineno}\t{rec.kind}\t{message}")
+        append = issues.append
+        prefix = f"{path}:"
+        names, kinds, lines = self._rec_name, self._rec_kind, self._rec_line
+        released = self._rec_released
+        leaked = [index for index in range(len(released)) if not released[index]]
+        leaked.sort(key=lambda i: (lines[i], kinds[i], names[i] or ""))
+        for index in leaked:
+            kind = kinds[index]
+            template = MESSAGE_TEMPLATES.get(kind, "Resource not released")
+            message = template.format(name=names[index] or kind)
+            append(prefix + str(lines[index]) + "\t" + kind + "\t" + message)
         return issues
 
 
 def collect_files(root: Path) -> list[Path]:
-    files: list[Path] = []
     if root.is_file() and root.suffix == ".py":
         return [root]
-    for path in root.rglob("*.py"):
-        if any(part in IGNORED_PARTS for part in path.parts):
+    files: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
             continue
-        files.append(path)
+        with it:
+            for entry in it:
+                # Prune ignored trees before descending instead of filtering
+                # every file found under them afterwards.
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_PARTS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    files.append(Path(entry.path))
     return files
 
 
-def analyze(path: Path, root: Path) -> list[str]:
+def analyze(path: Path, root: Path, analyzer: Optional[Analyzer] = None) -> list[str]:
     try:
-        text = path.read_text(encoding="utf-8")
+        data = path.read_bytes()
     except OSError as e:
         print(f"WARN: Could not read {path}: {e}", file=sys.stderr)
         return []
+    if not _has_needle(data):
+        return []
     try:
-        tree = ast.parse(text)
-    except SyntaxError as e:
+        # Parsing bytes lets the compiler decode (honouring coding cookies)
+        # instead of decoding to str first and re-encoding internally.
+        tree = compile(data, str(path), "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+    except (SyntaxError, ValueError) as e:
         print(f"WARN: Syntax error in {path}: {e}", file=sys.stderr)
         return []
-    analyzer = Analyzer(tree)
-    analyzer.visit(tree)
+    if analyzer is None:
+        analyzer = Analyzer()
+    else:
+        analyzer.reset()
+    analyzer.walk(tree)
     display: Path
     try:
         display = path.relative_to(root)
@@ -302,18 +524,134 @@ def analyze(path: Path, root: Path) -> list[str]:
     return analyzer.report(display)
 
 
+def _helper_stamp() -> list[object]:
+    # The interpreter is part of the stamp: what parses differs between
+    # Python versions, so results cached under one must not be reused by
+    # another (ubs-python.sh runs whichever python3 is first on PATH).
+    st = Path(__file__).stat()
+    return [st.st_mtime_ns, st.st_size, sys.implementation.cache_tag or sys.version]
+
+
+def cache_file_for(root: Path) -> Optional[Path]:
+    """Return the cache file for root, or None when no cache dir is usable."""
+    try:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    except (RuntimeError, KeyError, OSError):
+        # No HOME and no passwd entry for this UID: run without a cache.
+        return None
+    digest = hashlib.sha1(str(root.resolve()).encode("utf-8")).hexdigest()
+    return base / "ubs" / "py_lifecycle" / f"{digest}.json"
+
+
+def load_cache(cache_file: Path) -> dict[str, CacheEntry]:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    # Results from an older helper may no longer be what it would report.
+    if not isinstance(data, dict) or data.get("helper") != _helper_stamp():
+        return {}
+    files = data.get("files")
+    if not isinstance(files, dict):
+        return {}
+    cache: dict[str, CacheEntry] = {}
+    for key, entry in files.items():
+        # JSON hands back lists; keep the declared tuple shape for mypyc.
+        if isinstance(entry, list) and len(entry) == 3:
+            cache[key] = (entry[0], entry[1], entry[2])
+    return cache
+
+
+def save_cache(cache_file: Path, cache: dict[str, CacheEntry]) -> None:
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({"helper": _helper_stamp(), "files": cache}), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        print(f"WARN: Could not write cache {cache_file}: {e}", file=sys.stderr)
+        tmp.unlink(missing_ok=True)
+
+
+def analyze_all(files: list[Path], root: Path) -> Generator[list[str], None, None]:
+    """Yield each file's issues in input order as soon as they are ready."""
+    if len(files) < PARALLEL_MIN_FILES:
+        analyzer = Analyzer()
+        for path in files:
+            yield analyze(path, root, analyzer)
+        return
+    cpu = os.cpu_count() or 1
+    chunksize = max(1, len(files) // (cpu * 8))
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(analyze, files, repeat(root), chunksize=chunksize)
+
+
 def main() -> None:
     print("Starting main...", file=sys.stderr)
     if len(sys.argv) != 2:
         print("usage: resource_lifecycle_py.py <project_dir>", file=sys.stderr)
         sys.exit(2)
     root = Path(sys.argv[1])
-    issues: list[str] = []
-    for path in sorted(collect_files(root), key=lambda p: str(p)):
-        issues.extend(analyze(path, root))
-    if issues:
-        print("\n".join(issues))
+    files = sorted(collect_files(root), key=lambda p: str(p))
+    cache_file = cache_file_for(root)
+    cache = load_cache(cache_file) if cache_file is not None else {}
+    stats: list[Optional[os.stat_result]] = []
+    hits: list[Optional[list[str]]] = []
+    pending: list[Path] = []
+    for path in files:
+        try:
+            st: Optional[os.stat_result] = path.stat()
+        except OSError:
+            st = None
+        entry = cache.get(str(path))
+        stats.append(st)
+        if st is not None and entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            hits.append(entry[2])
+        else:
+            hits.append(None)
+            pending.append(path)
+    # Issues go out file by file; only the cache index keeps every result.
+    # Files seen this run are the only ones written back, so deleted files
+    # age out.
+    fresh: dict[str, CacheEntry] = {}
+    analyzed = analyze_all(pending, root)
+    write = sys.stdout.write
+    for path, st, result in zip(files, stats, hits):
+        if result is None:
+            result = next(analyzed)
+        if st is not None:
+            fresh[str(path)] = (st.st_mtime_ns, st.st_size, result)
+        if result:
+            write("\n".join(result) + "\n")
+    analyzed.close()
+    sys.stdout.flush()
+    if cache_file is not None and (pending or fresh.keys() != cache.keys()):
+        save_cache(cache_file, fresh)
+
+
+def _entry_point() -> Callable[[], None]:
+    # scripts/build_native_helpers.sh compiles this file with mypyc and drops
+    # the extension next to it; prefer that build when it loads and was
+    # compiled from exactly this source. A stale build (e.g. after a pull, as
+    # *.so is gitignored) falls back to the pure-Python analyzer.
+    source = Path(__file__)
+    here = source.resolve().parent
+    stem = source.stem
+    if any((here / f"{stem}{suffix}").exists() for suffix in importlib.machinery.EXTENSION_SUFFIXES):
+        try:
+            native = importlib.import_module(stem)
+        except ImportError:
+            return main
+        if native.__file__ == __file__:
+            return main
+        try:
+            digest = hashlib.sha256(source.read_bytes()).hexdigest()
+        except OSError:
+            return main
+        if getattr(native, "SOURCE_DIGEST", "") == digest:
+            return native.main  # type: ignore[no-any-return]
+    return main
 
 
 if __name__ == "__main__":
-    main()
+    _entry_point()()
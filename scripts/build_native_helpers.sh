@@ -0,0 +1,40 @@
+#!/usr/bin/env bash
+# Compile the Python AST helpers to native extensions with mypyc.
+# The .py sources stay the entry points; they pick up the compiled module
+# sitting next to them when it matches the running interpreter.
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd -- "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd -- "$SCRIPT_DIR/.." && pwd)"
+HELPERS_DIR="$PROJECT_ROOT/modules/helpers"
+PYTHON="${PYTHON:-python3}"
+
+if ! "$PYTHON" -c "import mypyc" >/dev/null 2>&1; then
+  echo "mypyc not found for $PYTHON – install it with: $PYTHON -m pip install mypy setuptools" >&2
+  exit 1
+fi
+
+BUILD_DIR="$(mktemp -d)"
+trap 'rm -rf "$BUILD_DIR"' EXIT
+
+cd "$BUILD_DIR"
+# Stamp the copy with the source's hash so the .py entry point can tell a
+# stale extension from a current one.
+"$PYTHON" - "$HELPERS_DIR/resource_lifecycle_py.py" resource_lifecycle_py.py <<'PY'
+import hashlib
+import sys
+from pathlib import Path
+
+source = Path(sys.argv[1]).read_bytes()
+marker = 'SOURCE_DIGEST: Final = ""'
+text = source.decode("utf-8")
+if text.count(marker) != 1:
+    sys.exit(f"{sys.argv[1]}: expected exactly one {marker!r} line")
+stamped = f'SOURCE_DIGEST: Final = "{hashlib.sha256(source).hexdigest()}"'
+Path(sys.argv[2]).write_text(text.replace(marker, stamped), encoding="utf-8")
+PY
+"$PYTHON" -m mypyc resource_lifecycle_py.py
+cp resource_lifecycle_py.*.so "$HELPERS_DIR/"
+
+echo "✓ Native helpers written to $HELPERS_DIR"
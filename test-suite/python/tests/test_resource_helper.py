@@ -2,6 +2,11 @@
 """Regression tests for the Python resource lifecycle helper."""
 from __future__ import annotations
 
+import hashlib
+import importlib.machinery
+import importlib.util
+import json
+import os
 import shutil
 import subprocess
 import sys
@@ -9,29 +14,49 @@ import tempfile
 import textwrap
 import unittest
 from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from unittest import mock
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 HELPER = REPO_ROOT / "modules" / "helpers" / "resource_lifecycle_py.py"
 
 
+def write_sources(project: Path, source_map: dict[str, str]) -> None:
+    for rel, code in source_map.items():
+        path = project / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(code), encoding="utf-8")
+
+
+def scan(project: Path, cache_home: Path) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, str(HELPER), str(project)],
+        capture_output=True,
+        text=True,
+        check=False,
+        env={**os.environ, "XDG_CACHE_HOME": str(cache_home)},
+    )
+    return [line for line in result.stdout.strip().splitlines() if line.strip()]
+
+
 def run_helper(source_map: dict[str, str]) -> list[str]:
     tmpdir = Path(tempfile.mkdtemp(prefix="ubs-resource-helper-"))
     try:
-        for rel, code in source_map.items():
-            path = tmpdir / rel
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(textwrap.dedent(code), encoding="utf-8")
-        result = subprocess.run(
-            [sys.executable, str(HELPER), str(tmpdir)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return [line for line in result.stdout.strip().splitlines() if line.strip()]
+        project = tmpdir / "project"
+        write_sources(project, source_map)
+        return scan(project, tmpdir / "cache")
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
 
 
+def load_helper(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location("resource_lifecycle_py_under_test", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def parse(lines: list[str]) -> list[tuple[str, str, str]]:
     entries: list[tuple[str, str, str]] = []
     for line in lines:
@@ -97,6 +122,186 @@ class ResourceHelperTests(unittest.TestCase):
         )
         self.assertEqual(lines, [])
 
+    def test_socket_close_releases_socket(self) -> None:
+        lines = run_helper(
+            {
+                "sock.py": """
+                import socket
+
+                def ping():
+                    sock = socket.socket()
+                    sock.connect(("localhost", 9))
+                    sock.close()
+                """,
+            }
+        )
+        self.assertEqual(lines, [])
+
+    def test_aliased_and_chained_opens_are_tracked(self) -> None:
+        lines = run_helper(
+            {
+                "alias.py": """
+                from io import open as io_open
+                from pathlib import Path
+
+                def leak():
+                    raw = io_open("/tmp/a.txt")
+                    text = Path("/tmp/b.txt").open()
+                    return raw, text
+                """,
+            }
+        )
+        names = sorted(message for _, _, message in parse(lines))
+        self.assertEqual(len(names), 2)
+        self.assertIn("raw", names[0])
+        self.assertIn("text", names[1])
+
+    def test_nested_and_starred_targets_are_named(self) -> None:
+        lines = run_helper(
+            {
+                "unpack.py": """
+                import socket
+
+                def pair():
+                    a, (b, *rest) = socket.socketpair()
+                    rest.close()
+                    b.close()
+                    return a
+
+                def spread():
+                    *socks, = socket.socketpair()
+                    return socks
+                """,
+            }
+        )
+        self.assertEqual(
+            parse(lines),
+            [
+                ("unpack.py:5", "socket_handle", "Socket a opened without close()"),
+                ("unpack.py:11", "socket_handle", "Socket socks opened without close()"),
+            ],
+        )
+
+    def test_non_utf8_sources_do_not_abort_scan(self) -> None:
+        tmpdir = Path(tempfile.mkdtemp(prefix="ubs-resource-helper-"))
+        try:
+            project = tmpdir / "project"
+            project.mkdir()
+            (project / "latin.py").write_bytes(
+                b"# -*- coding: latin-1 -*-\nlabel = '\xe9t\xe9'\nfh = open('/tmp/demo.txt')\n"
+            )
+            (project / "broken.py").write_bytes(b"fh = open('\xff\xfe')\n")
+            lines = scan(project, tmpdir / "cache")
+            self.assertEqual([location for location, _, _ in parse(lines)], ["latin.py:3"])
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test_ignored_directories_are_skipped(self) -> None:
+        leaky = """
+        fh = open("/tmp/demo.txt")
+        """
+        lines = run_helper(
+            {
+                "app.py": leaky,
+                "node_modules/pkg/vendored.py": leaky,
+                ".venv/lib/site.py": leaky,
+            }
+        )
+        self.assertEqual([location for location, _, _ in parse(lines)], ["app.py:2"])
+
+    def test_root_under_ignored_name_is_scanned(self) -> None:
+        tmpdir = Path(tempfile.mkdtemp(prefix="ubs-resource-helper-"))
+        try:
+            project = tmpdir / "build" / "site-packages" / "project"
+            write_sources(project, {"app.py": 'fh = open("/tmp/demo.txt")\n'})
+            lines = scan(project, tmpdir / "cache")
+            self.assertEqual([location for location, _, _ in parse(lines)], ["app.py:1"])
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test_cache_is_invalidated_when_file_changes(self) -> None:
+        tmpdir = Path(tempfile.mkdtemp(prefix="ubs-resource-helper-"))
+        try:
+            project = tmpdir / "project"
+            cache_home = tmpdir / "cache"
+            write_sources(project, {"app.py": 'fh = open("/tmp/demo.txt")\n'})
+            self.assertEqual(len(scan(project, cache_home)), 1)
+            self.assertTrue(any((cache_home / "ubs" / "py_lifecycle").glob("*.json")))
+            self.assertEqual(len(scan(project, cache_home)), 1)
+            write_sources(project, {"app.py": 'with open("/tmp/demo.txt") as fh:\n    pass\n'})
+            self.assertEqual(scan(project, cache_home), [])
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test_cache_from_another_interpreter_is_dropped(self) -> None:
+        tmpdir = Path(tempfile.mkdtemp(prefix="ubs-resource-helper-"))
+        try:
+            project = tmpdir / "project"
+            cache_home = tmpdir / "cache"
+            write_sources(project, {"app.py": 'fh = open("/tmp/demo.txt")\n'})
+            self.assertEqual(len(scan(project, cache_home)), 1)
+            (cache_file,) = (cache_home / "ubs" / "py_lifecycle").glob("*.json")
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            # Blank the cached findings: a run that trusts the cache goes quiet.
+            for entry in data["files"].values():
+                entry[2] = []
+            cache_file.write_text(json.dumps(data), encoding="utf-8")
+            self.assertEqual(scan(project, cache_home), [])
+            data["helper"][-1] = "cpython-27"
+            cache_file.write_text(json.dumps(data), encoding="utf-8")
+            self.assertEqual(len(scan(project, cache_home)), 1)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test_stale_native_build_falls_back_to_source(self) -> None:
+        tmpdir = Path(tempfile.mkdtemp(prefix="ubs-resource-helper-"))
+        try:
+            copy = tmpdir / HELPER.name
+            shutil.copy(HELPER, copy)
+            suffix = importlib.machinery.EXTENSION_SUFFIXES[0]
+            (tmpdir / f"{copy.stem}{suffix}").touch()
+            helper = load_helper(copy)
+            native_main = object()
+            native = SimpleNamespace(
+                __file__=str(tmpdir / f"{copy.stem}{suffix}"),
+                SOURCE_DIGEST="0" * 64,
+                main=native_main,
+            )
+            with mock.patch.object(helper.importlib, "import_module", return_value=native):
+                self.assertIs(helper._entry_point(), helper.main)
+                native.SOURCE_DIGEST = hashlib.sha256(copy.read_bytes()).hexdigest()
+                self.assertIs(helper._entry_point(), native_main)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test_hyperscan_and_re_prefilters_agree(self) -> None:
+        helper = load_helper(HELPER)
+        hs_search = helper._hyperscan_needle_search(helper._NEEDLES)
+        if hs_search is None:
+            self.skipTest("hyperscan not installed or unusable")
+        re_search = helper._re_needle_search(helper._NEEDLES)
+        samples = [b"", b"print('hi')\n", b"value = None\n" * 500]
+        for _, name in helper.TARGET_SIGS:
+            samples.append(f"x = {name}(arg)\n".encode())
+            samples.append(b"pad\n" * 1000 + name.encode())
+        for data in samples:
+            with self.subTest(data=data[:40]):
+                self.assertEqual(hs_search(data), re_search(data))
+        self.assertTrue(any(hs_search(data) for data in samples))
+        self.assertFalse(hs_search(b"print('hi')\n"))
+
+    def test_large_project_reports_in_path_order(self) -> None:
+        leaky = """
+        def leak():
+            fh = open("/tmp/demo.txt")
+            return fh
+        """
+        sources = {f"pkg/mod_{i:03d}.py": leaky for i in range(40)}
+        lines = run_helper(sources)
+        locations = [location for location, _, _ in parse(lines)]
+        self.assertEqual(len(locations), 40)
+        self.assertEqual(locations, sorted(locations))
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()